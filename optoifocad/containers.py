@@ -4,8 +4,9 @@ from typing import Any
 from dataclasses import dataclass, field
 
 
-class OptocadScript(list):
-    """Optocad script container."""
+# Optocad script container: a plain list of commands, with no subclass overhead.
+# `OptocadScript()` creates an empty script.
+OptocadScript = list
 
 
 @dataclass
@@ -39,6 +40,7 @@ class OptocadSecondarySurfaceCommand:
 
 @dataclass
 class OptocadUnaryExpression:
+    __slots__ = ("operator", "argument")
     operator: str
     argument: Any
 
@@ -47,6 +49,7 @@ class OptocadUnaryExpression:
 
 @dataclass
 class OptocadBinaryExpression:
+    __slots__ = ("operator", "lhs", "rhs")
     operator: str
     lhs: Any
     rhs: Any
@@ -4,8 +4,7 @@
 
 import logging
 from io import StringIO
-from .tokenizer import OptocadTokenizer
-from .memoize import memoize, memoize_left_rec
+from .tokenizer import Token, OptocadTokenizer
 from .containers import (
     OptocadScript,
     OptocadCommand,
@@ -18,29 +17,47 @@ from .exceptions import OptocadSyntaxError
 LOGGER = logging.getLogger(__name__)
 
 
-class __empty_cls:
-    """Internal class representing an empty line."""
+# Token types that can start each production, used to skip productions that can't match
+# the next token.
+_ACTION_FIRST = frozenset(("LBRACE", "LBRACKET", "LPAREN", "NAME"))
+_EXPR_FIRST = frozenset(("PLUS", "MINUS", "LPAREN", "NUMBER"))
+_ATOM_FIRST = frozenset(("LPAREN", "NUMBER"))
 
-EMPTY = __empty_cls()
+# Token types that can follow the last item on a line.
+_LINE_END = frozenset(("NEWLINE", "COMMENT"))
+
+# Characters making up action strings.
+_ACTION_CHARS = frozenset("cdhinrstv")
+
+# Binary operator precedences (higher binds more tightly).
+_BINARY_PRECEDENCE = {
+    "PLUS": 1,
+    "MINUS": 1,
+    "TIMES": 2,
+    "DIVIDE": 2,
+    "FLOORDIVIDE": 2,
+}
 
 
 class OptocadParser:
     """Optocad script parser.
 
-    This uses so-called *packrat* parsing to reduce, via productions, tokens yielded
-    from a token stream generated from an input file or string to
-    :class:`.OptocadScriptItem` objects containing the associated :class:`tokens
-    <.Token>`.
+    This uses recursive descent parsing, with limited backtracking, to reduce, via
+    productions, tokens yielded from a token stream generated from an input file or
+    string to :class:`.OptocadScriptItem` objects containing the associated
+    :class:`tokens <.Token>`.
     """
 
     def __init__(self):
         self.tokens = None
         self.pos = None
-        self.memos = None
+        self._tokens_start = None
         self.optocad_script = None
         self._filename = None
         self._tokenizer = None
         self._token_stream = None
+        self._trace = None
+        self._log_stack = None
 
     @property
     def script(self):
@@ -78,16 +95,19 @@ class OptocadParser:
         # Reset parser state.
         self.tokens = []
         self.pos = 0
-        self.memos = {}
+        self._tokens_start = 0
         self.optocad_script = OptocadScript()
         self._filename = fobj.name
+        # Only trace productions when debug logging is enabled, since building the log
+        # messages is expensive.
+        self._trace = LOGGER.isEnabledFor(logging.DEBUG)
         self._log_stack = []
 
         # Perform parse.
         self._tokenizer = OptocadTokenizer()
         self._token_stream = self._tokenizer.tokenize_file(fobj)
 
-        if (script := self.expect_production("start")) is not None:
+        if (script := self.expect_production(self.start)) is not None:
             return script
 
         # There was an error.
@@ -95,9 +115,10 @@ class OptocadParser:
 
     def _diagnose_error(self):
         if not self.tokens:
-            error_token = self.peek_token()
-        else:
-            error_token = self.tokens[-1]
+            # Nothing has been read since the buffer was last discarded.
+            self.tokens.append(next(self._token_stream))
+
+        error_token = Token._make(self.tokens[-1])
 
         raise OptocadSyntaxError(
             "syntax error",
@@ -123,50 +144,57 @@ class OptocadParser:
         return token
 
     def peek_token(self):
-        if self.pos == len(self.tokens):
+        index = self.pos - self._tokens_start
+        if index == len(self.tokens):
             self.tokens.append(next(self._token_stream))
-        return self.tokens[self.pos]
+        return self.tokens[index]
+
+    def discard_tokens(self):
+        """Discard the buffered tokens before the current position.
+
+        Only call this where the parser will never backtrack to an earlier position.
+        `tokens` then only holds tokens read since, rather than the whole script.
+        """
+        del self.tokens[: self.pos - self._tokens_start]
+        self._tokens_start = self.pos
+
+    # Peeking never consumes a token, so lookaheads have no position to reset.
 
     def positive_lookahead(self, token_type):
-        pos = self.mark()
-        token = self.peek_token()
-        self.reset(pos)
-        return token.type == token_type
+        return self.peek_token()[3] is token_type
 
     def negative_lookahead(self, token_type):
-        return not self.positive_lookahead(token_type)
+        return self.peek_token()[3] is not token_type
 
-    def maybe_token(self, token_type):
-        pos = self.mark()
-        if (
-            True
-            and (TOKEN := self.expect_token(token_type)) is not None
-        ):
-            return TOKEN
-        self.reset(pos)
-        return EMPTY
+    # Optional items are matched in productions as `(item,)`, which is always true; a
+    # failed match consumes nothing and leaves `None` in the tuple.
 
     def maybe_trailing_comma(self):
         pos = self.mark()
         if (
             True
             and (COMMA := self.expect_token("COMMA")) is not None
-            and (self.positive_lookahead("NEWLINE") or self.positive_lookahead("COMMENT"))
+            and self.peek_token()[3] in _LINE_END
         ):
             return COMMA
         self.reset(pos)
-        return EMPTY
 
-    @memoize
     def expect_token(self, arg):
+        # Token types are interned, so can be compared by identity with `arg` (which
+        # is always a string literal, and therefore also interned).
+        if not self._trace:
+            if self.peek_token()[3] is arg:
+                return self.get_token()
+            return
+
         self._log_stack.append(arg)
         path = "->".join(self._log_stack)
         # path = arg
         LOGGER.debug(f"{path}?")
         token = self.peek_token()
 
-        if token.type == arg:
-            LOGGER.debug(f"{path} = {token!r}!")
+        if token[3] is arg:
+            LOGGER.debug(f"{path} = {Token._make(token)!r}!")
             result = self.get_token()
             self._log_stack.pop()
             return result
@@ -175,60 +203,69 @@ class OptocadParser:
         self._log_stack.pop()
 
     def expect_production(self, production):
-        self._log_stack.append(production)
+        if not self._trace:
+            return production()
+
+        name = production.__name__
+        self._log_stack.append(name)
         path = "->".join(self._log_stack)
-        # path = production
+        # path = name
         LOGGER.debug(f"{path}?")
 
-        result = getattr(self, production)()
+        result = production()
 
         if result is not None:
             LOGGER.debug(f"{path} = {result!r}!")
             self._log_stack.pop()
             return result
 
-        LOGGER.debug(f"{production} not found")
+        LOGGER.debug(f"{name} not found")
         self._log_stack.pop()
 
-    def loop_token(self, token, nonempty):
-        mark = self.mark()
+    # Failed matches don't consume anything, so the loops below never need to reset the
+    # position, even when the plus variants fail.
+
+    def loop_token_star(self, token):
         nodes = []
         while (node := self.expect_token(token)) is not None:
             nodes.append(node)
-        if len(nodes) >= nonempty:
+        return nodes
+
+    def loop_token_plus(self, token):
+        if nodes := self.loop_token_star(token):
             return nodes
-        self.reset(mark)
 
-    def loop_production(self, production, nonempty):
-        mark = self.mark()
+    def loop_production_star(self, production):
         nodes = []
         while (node := self.expect_production(production)) is not None:
             nodes.append(node)
-        if len(nodes) >= nonempty:
+        return nodes
+
+    def loop_production_plus(self, production):
+        if nodes := self.loop_production_star(production):
             return nodes
-        self.reset(mark)
 
     def start(self):
-        pos = self.mark()
-
-        if (
-            True
-            and self.loop_production("script_line", False) is not None
-            and self.expect_token("ENDMARKER") is not None
-        ):
+        # start -> script_line* ENDMARKER
+        # This loop runs for every line, so call the production directly. Lines are
+        # never backtracked into once parsed, so their tokens can be discarded. There is
+        # then nothing to reset to if ENDMARKER doesn't follow.
+        script_line = self.script_line
+        discard_tokens = self.discard_tokens
+        while script_line() is not None:
+            discard_tokens()
+
+        if self.expect_token("ENDMARKER") is not None:
             return self.optocad_script
 
-        self.reset(pos)
-
-    @memoize
     def script_line(self):
         pos = self.mark()
 
         # script_line -> command COMMENT? NEWLINE
         if (
             True
-            and (command := self.expect_production("command")) is not None
-            and self.maybe_token("COMMENT") is not None
+            and (command := self.expect_production(self.command)) is not None
+            and (self.expect_token("COMMENT"),)
             and self.expect_token("NEWLINE") is not None
         ):
             if isinstance(command, OptocadSecondarySurfaceCommand):
@@ -255,14 +292,13 @@ class OptocadParser:
         # script_line -> COMMENT? NEWLINE
         if (
             True
-            and self.maybe_token("COMMENT") is not None
-            and self.expect_token("NEWLINE") is not None
+            and (self.expect_token("COMMENT"),)
+            and (NEWLINE := self.expect_token("NEWLINE")) is not None
         ):
-            return EMPTY
+            return NEWLINE
 
         self.reset(pos)
 
-    @memoize
     def command(self):
         pos = self.mark()
 
@@ -270,10 +306,10 @@ class OptocadParser:
         if (
             True
             and (COMMAND := self.expect_token("NAME")) is not None
-            and (command_params := self.expect_production("command_params")) is not None
+            and (command_params := self.expect_production(self.command_params)) is not None
         ):
             args, kwargs = command_params
-            return OptocadCommand(directive=COMMAND.value, args=args, kwargs=kwargs)
+            return OptocadCommand(directive=COMMAND[4], args=args, kwargs=kwargs)
 
         self.reset(pos)
 
@@ -281,24 +317,23 @@ class OptocadParser:
         if (
             True
             and self.expect_token("PLUS") is not None
-            and (command_params := self.expect_production("command_params")) is not None
+            and (command_params := self.expect_production(self.command_params)) is not None
         ):
             args, kwargs = command_params
             return OptocadSecondarySurfaceCommand(args=args, kwargs=kwargs)
 
         self.reset(pos)
 
-    @memoize
     def command_params(self):
         pos = self.mark()
 
         # command_params -> command_value_list ',' command_key_value_list ','?
         if (
             True
-            and (command_value_list := self.expect_production("command_value_list")) is not None
+            and (command_value_list := self.expect_production(self.command_value_list)) is not None
             and self.expect_token("COMMA") is not None
-            and (command_key_value_list := self.expect_production("command_key_value_list")) is not None
-            and self.maybe_trailing_comma() is not None
+            and (command_key_value_list := self.expect_production(self.command_key_value_list)) is not None
+            and (self.maybe_trailing_comma(),)
         ):
             return command_value_list, command_key_value_list
 
@@ -307,8 +342,8 @@ class OptocadParser:
         # command_params -> command_value_list ','?
         if (
             True
-            and (command_value_list := self.expect_production("command_value_list")) is not None
-            and self.maybe_trailing_comma() is not None
+            and (command_value_list := self.expect_production(self.command_value_list)) is not None
+            and (self.maybe_trailing_comma(),)
         ):
             return command_value_list, {}
 
@@ -317,282 +352,236 @@ class OptocadParser:
         # command_params -> command_key_value_list ','?
         if (
             True
-            and (command_key_value_list := self.expect_production("command_key_value_list")) is not None
-            and self.maybe_trailing_comma() is not None
+            and (command_key_value_list := self.expect_production(self.command_key_value_list)) is not None
+            and (self.maybe_trailing_comma(),)
         ):
             return [], command_key_value_list
 
         self.reset(pos)
 
-    @memoize
     def command_value_list(self):
         pos = self.mark()
+        values = []
 
-        # command_value_list -> positional_value ',' command_value_list
-        if (
-            True
-            and (positional_value := self.expect_production("positional_value")) is not None
-            and self.expect_token("COMMA") is not None
-            and (command_value_list := self.expect_production("command_value_list")) is not None
-        ):
-            return [positional_value, *command_value_list]
-
-        self.reset(pos)
+        # command_value_list -> positional_value (',' positional_value)*
+        # A comma is only consumed if another positional value follows it.
+        while (positional_value := self.expect_production(self.positional_value)) is not None:
+            values.append(positional_value)
+            pos = self.mark()
 
-        # command_value_list -> positional_value
-        if (positional_value := self.expect_production("positional_value")) is not None:
-            return [positional_value]
+            if self.expect_token("COMMA") is None:
+                break
 
         self.reset(pos)
 
-    @memoize_left_rec
+        if values:
+            return values
+
     def command_key_value_list(self):
         pos = self.mark()
+        key_values = {}
 
-        # command_key_value_list -> command_key_value_list ',' command_key_value_list
-        if (
+        # command_key_value_list -> key_value (','+ key_value)*
+        # key_value -> NAME '=' value
+        # Commas are only consumed if another key/value pair follows them.
+        while (
             True
-            and (command_key_value_list1 := self.expect_production("command_key_value_list")) is not None
-            and self.loop_token("COMMA", True) is not None
-            and (command_key_value_list2 := self.expect_production("command_key_value_list")) is not None
+            and (NAME := self.expect_token("NAME")) is not None
+            and (EQUALS := self.expect_token("EQUALS")) is not None
         ):
-            return {**command_key_value_list1, **command_key_value_list2}
+            if (value := self.expect_production(self.value)) is None:
+                raise OptocadSyntaxError(
+                    "missing value",
+                    (
+                        self._filename,
+                        self._tokenizer.lineno,
+                        self._tokenizer.index,
+                        EQUALS[4]
+                    )
+                )
 
-        self.reset(pos)
+            key_values[NAME[4]] = value
+            pos = self.mark()
 
-        # command_key_value_list -> key_value
-        if (key_value := self.expect_production("key_value")) is not None:
-            return key_value
+            if self.loop_token_plus("COMMA") is None:
+                break
 
         self.reset(pos)
 
-    @memoize
+        if key_values:
+            return key_values
+
     def positional_value(self):
         pos = self.mark()
 
         # Don't match values followed by '=', which are kwarg keys.
         if (
             True
-            and (value := self.expect_production("value")) is not None
+            and (value := self.expect_production(self.value)) is not None
             and self.negative_lookahead("EQUALS")
         ):
             return value
 
         self.reset(pos)
 
-    @memoize
     def value(self):
         pos = self.mark()
+        token_type = self.peek_token()[3]
 
         # value -> action
-        if (action := self.expect_production("action")) is not None:
-            return action
-
-        self.reset(pos)
-
-        # value -> expr
-        if (expr := self.expect_production("expr")) is not None:
-            return expr
-
-        self.reset(pos)
-
-    @memoize
-    def key_value(self):
-        pos = self.mark()
-
-        # key_value -> NAME '=' value
         if (
             True
-            and (NAME := self.expect_token("NAME")) is not None
-            and self.expect_token("EQUALS") is not None
-            and (value := self.expect_production("value")) is not None
+            and token_type in _ACTION_FIRST
+            and (action := self.expect_production(self.action)) is not None
         ):
-            return {NAME.value: value}
+            return action
 
         self.reset(pos)
 
+        # value -> expr
         if (
             True
-            and (NAME := self.expect_token("NAME")) is not None
-            and (EQUALS := self.expect_token("EQUALS")) is not None
-            and self.expect_production("value") is None  # !
+            and token_type in _EXPR_FIRST
+            and (expr := self.expect_production(self.expr)) is not None
         ):
-            raise OptocadSyntaxError(
-                "missing value",
-                (
-                    self._filename,
-                    self._tokenizer.lineno,
-                    self._tokenizer.index,
-                    EQUALS.value
-                )
-            )
+            return expr
 
         self.reset(pos)
 
-    @memoize_left_rec
     def action(self):
-        pos = self.mark()
+        # action -> single_action+
+        # Actions are concatenated in one go rather than by left recursion.
+        if (parts := self.loop_production_plus(self.single_action)) is not None:
+            return "".join(parts)
 
-        # action -> action action
-        if (
-            True
-            and (action1 := self.expect_production("action")) is not None
-            and (action2 := self.expect_production("action")) is not None
-        ):
-            return action1 + action2
+    def single_action(self):
+        pos = self.mark()
 
-        self.reset(pos)
+        if self.peek_token()[3] not in _ACTION_FIRST:
+            return
 
-        # action -> '{' action '}' NUMBER?
+        # single_action -> '{' action '}' NUMBER?
         if (
             True
             and self.expect_token("LBRACE") is not None
-            and (action := self.expect_production("action")) is not None
+            and (action := self.expect_production(self.action)) is not None
             and self.expect_token("RBRACE") is not None
-            and (NUMBER := self.maybe_token("NUMBER")) is not None
+            and (NUMBER := self.expect_token("NUMBER"),)
         ):
+            if NUMBER is None:
+                return "{" + action + "}"
+
             try:
-                if NUMBER is not None and NUMBER is not EMPTY:
-                    NUMBER = int(NUMBER.value)
+                return "{" + action + "}" + str(int(NUMBER[4]))
             except ValueError:
                 # Not an integer.
                 pass
-            else:
-                if NUMBER is None or NUMBER is EMPTY:
-                    NUMBER = ""
-
-                return "{" + action + "}" + NUMBER
 
         self.reset(pos)
 
-        # action -> '[' action ']'
+        # single_action -> '[' action ']'
         if (
             True
             and self.expect_token("LBRACKET") is not None
-            and (action := self.expect_production("action")) is not None
+            and (action := self.expect_production(self.action)) is not None
             and self.expect_token("RBRACKET") is not None
         ):
             return "[" + action + "]"
 
         self.reset(pos)
 
-        # action -> '(' action ')'
+        # single_action -> '(' action ')'
         if (
             True
             and self.expect_token("LPAREN") is not None
-            and (action := self.expect_production("action")) is not None
+            and (action := self.expect_production(self.action)) is not None
             and self.expect_token("RPAREN") is not None
         ):
             return "(" + action + ")"
 
         self.reset(pos)
 
-        # action -> ('c' | 'd' | 'h' | 'i' | 'n' | 'r' | 's' | 't' | 'v')+
+        # single_action -> ('c' | 'd' | 'h' | 'i' | 'n' | 'r' | 's' | 't' | 'v')+
         if (
             True
             and (NAME := self.expect_token("NAME")) is not None
         ):
-            if set(NAME.value) <= set("cdhinrstv"):
-                return NAME.value
+            if _ACTION_CHARS.issuperset(NAME[4]):
+                return NAME[4]
 
         self.reset(pos)
 
-    @memoize_left_rec
     def expr(self):
-        pos = self.mark()
+        """Binary plus, minus, times, divide and floordivide operators.
 
-        # NOTE: operator precedence is set by defining productions within productions.
-        # expr -> expr ( '+' / '-' ) expr1
-        for operator in ("PLUS", "MINUS"):
-            if (
-                True
-                and (lhs := self.expect_production("expr")) is not None
-                and (operator := self.expect_token(operator)) is not None
-                and (rhs := self.expect_production("expr1")) is not None
-            ):
-                return OptocadBinaryExpression(
-                    operator=operator.value, lhs=lhs, rhs=rhs
-                )
-
-            self.reset(pos)
+        Operator precedence is handled by precedence climbing rather than by defining
+        productions within productions.
+        """
+        return self._binary_expr(1)
 
-        # expr -> expr1
-        if (expr1 := self.expect_production("expr1")) is not None:
-            return expr1
+    def _binary_expr(self, min_precedence):
+        # expr -> unary_expr ( operator expr )*
+        # All binary operators here are left associative, so the right hand side only
+        # takes operators of strictly higher precedence.
+        if (lhs := self.expect_production(self.unary_expr)) is None:
+            return
 
-        self.reset(pos)
+        while (
+            precedence := _BINARY_PRECEDENCE.get(self.peek_token()[3], 0)
+        ) >= min_precedence:
+            pos = self.mark()
+            operator = self.get_token()
 
-    @memoize_left_rec
-    def expr1(self):
-        """Times, divide and floordivide operators."""
-        pos = self.mark()
+            if (rhs := self._binary_expr(precedence + 1)) is None:
+                # Leave the operator for something else to match.
+                self.reset(pos)
+                break
 
-        # expr1 -> expr1 ( '*' / '/' / '//' ) expr2
-        for operator in ("TIMES", "DIVIDE", "FLOORDIVIDE"):
-            if (
-                True
-                and (lhs := self.expect_production("expr1")) is not None
-                and (operator := self.expect_token(operator)) is not None
-                and (rhs := self.expect_production("expr2")) is not None
-            ):
-                return OptocadBinaryExpression(
-                    operator=operator.value, lhs=lhs, rhs=rhs
-                )
+            lhs = OptocadBinaryExpression(operator=operator[4], lhs=lhs, rhs=rhs)
 
-            self.reset(pos)
+        return lhs
 
-        # expr1 -> expr2
-        if (expr2 := self.expect_production("expr2")) is not None:
-            return expr2
+    def unary_expr(self):
+        """Unary and power operators."""
+        pos = self.mark()
+        token_type = self.peek_token()[3]
 
-        self.reset(pos)
+        # unary_expr -> ( '+' / '-' ) unary_expr
+        if token_type == "PLUS" or token_type == "MINUS":
+            operator = self.expect_token(token_type)
+            # Only a number directly following the sign has it folded in. Anything else,
+            # e.g. a signed or parenthesised operand, stays an expression.
+            number = self.positive_lookahead("NUMBER")
 
-    @memoize
-    def expr2(self):
-        """Unary operators."""
-        pos = self.mark()
+            if (argument := self.expect_production(self.unary_expr)) is not None:
+                if number and isinstance(argument, str):
+                    return operator[4] + argument
 
-        # expr2 -> ( '+' / '-' ) expr2
-        for unary_operator in ("PLUS", "MINUS"):
-            if (
-                True
-                and (operator := self.expect_token(unary_operator)) is not None
-                and (expr2 := self.expect_production("expr2")) is not None
-            ):
-                return OptocadUnaryExpression(operator=operator.value, argument=expr2)
+                return OptocadUnaryExpression(operator=operator[4], argument=argument)
 
+            # Nothing else can start with an operator.
             self.reset(pos)
+            return
 
-        # expr2 -> expr3
-        if (expr3 := self.expect_production("expr3")) is not None:
-            return expr3
-
-        self.reset(pos)
+        if (atom := self.expect_production(self.atom)) is None:
+            return
 
-    @memoize
-    def expr3(self):
-        """Power operator."""
         pos = self.mark()
 
-        # expr3 -> expr4 '**' expr2
+        # unary_expr -> atom '**' unary_expr
         if (
             True
-            and (expr4 := self.expect_production("expr4")) is not None
             and (power := self.expect_token("POWER")) is not None
-            and (expr2 := self.expect_production("expr2")) is not None
+            and (exponent := self.expect_production(self.unary_expr)) is not None
         ):
-            return OptocadBinaryExpression(operator=power.value, lhs=expr4, rhs=expr2)
+            return OptocadBinaryExpression(operator=power[4], lhs=atom, rhs=exponent)
 
         self.reset(pos)
 
-        # expr3 -> expr4
-        if (expr4 := self.expect_production("expr4")) is not None:
-            return expr4
-
-        self.reset(pos)
+        # unary_expr -> atom
+        return atom
 
-    @memoize
-    def expr4(self):
+    def atom(self):
         """Parentheses, references, names and numbers.
 
         Names are allowed here to support keywords and copy-/read-by-value parameters
@@ -600,18 +589,21 @@ class OptocadParser:
         """
         pos = self.mark()
 
-        # expr4 -> '(' expr ')'
+        if self.peek_token()[3] not in _ATOM_FIRST:
+            return
+
+        # atom -> '(' expr ')'
         if (
             True
             and self.expect_token("LPAREN") is not None
-            and (expr := self.expect_production("expr")) is not None
+            and (expr := self.expect_production(self.expr)) is not None
             and self.expect_token("RPAREN") is not None
         ):
             return expr
 
         self.reset(pos)
 
-        # expr4 -> NUMBER
+        # atom -> NUMBER
         # Disallow matching of subsequent numbers, which indicates the tokenizer failed
         # to group two numbers together, and therefore a syntax error (handled later).
         if (
@@ -619,17 +611,16 @@ class OptocadParser:
             and (TOKEN := self.expect_token("NUMBER")) is not None
             and self.negative_lookahead("NUMBER")
         ):
-            return TOKEN.value
+            return TOKEN[4]
 
         self.reset(pos)
 
-        if (error := self.expect_production("invalid_expr4")) is not None:
+        if (error := self.expect_production(self.invalid_atom)) is not None:
             raise error
 
         self.reset(pos)
 
-    @memoize
-    def invalid_expr4(self):
+    def invalid_atom(self):
         pos = self.mark()
 
         # Invalid number: two numbers tokenized in a row, indicating a failure to match
@@ -639,15 +630,15 @@ class OptocadParser:
             and (NUMBER1 := self.expect_token("NUMBER"))
             and (NUMBER2 := self.expect_token("NUMBER"))
         ):
-            if isinstance(NUMBER1.value, int) and isinstance(NUMBER2.value, int):
+            if isinstance(NUMBER1[4], int) and isinstance(NUMBER2[4], int):
                 # Leading zeros (as per the to-number operation of the IBM
                 # specification; same behaviour as Python itself, see
                 # https://docs.python.org/3/library/decimal.html).
                 return OptocadSyntaxError(
-                    "leading zeros in integers are not permitted", self.script, NUMBER1
+                    "leading zeros in integers are not permitted", self.script, Token._make(NUMBER1)
                 )
 
             # Some other run-together, e.g. `0.1.1`.
-            return OptocadSyntaxError("invalid number syntax", self.script, NUMBER2)
+            return OptocadSyntaxError("invalid number syntax", self.script, Token._make(NUMBER2))
 
         self.reset(pos)
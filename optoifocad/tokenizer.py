@@ -1,9 +1,9 @@
 """Tokenizer for Optocad script."""
 
 import re
+import sys
 from io import StringIO
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple
 from .tokens import (
     NEWLINE,
     COMMENT,
@@ -15,8 +15,12 @@ from .tokens import (
 from .exceptions import OptocadSyntaxError
 
 
-@dataclass
-class Token:
+class Token(NamedTuple):
+    """Token with named fields.
+
+    The tokenizer yields plain tuples with the same layout, which are cheaper to create;
+    these can be converted with :meth:`Token._make` where the fields are needed by name.
+    """
     lineno: int
     start_index: int
     stop_index: int
@@ -33,36 +37,53 @@ class OptocadTokenizer:
 
     _TAB_SIZE = 4
 
-    # All token rules, in order of matching precedence.
+    # All token rules, in order of matching precedence. IGNORE and ERROR are not emitted
+    # as tokens. Literals share one rule, which is quicker to match than one rule each,
+    # and their token types are looked up from their values.
     _TOKEN_RULES = {
         "NEWLINE": NEWLINE,
         "COMMENT": COMMENT,
+        "IGNORE": r"[ \t]+",
         "NUMBER": NUMBER,  # Has to be above NAME (since it can match "inf")
         "STRING": STRING,
         "NAME": NAME,
-        **{key: re.escape(value) for key, value in LITERALS.items()},
+        "LITERAL": "|".join(re.escape(value) for value in LITERALS.values()),
+        "ERROR": r".",  # Has to be last.
     }
 
-    _IGNORE = " \t"
+    _LITERAL_TYPES = {value: sys.intern(key) for key, value in LITERALS.items()}
+
+    # Overall expression with named items, compiled once for all instances.
+    _MATCHER = re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in _TOKEN_RULES.items())
+    )
 
     def __init__(self):
         self.done = None
-        self.script = None
+        self._source = None
+        self._script = None
         self._filename = None
         self._lineno = None
         self._index = None
-        self._matcher = None
+        self._line_start = None
+        self._taboffset = None
         self._nesting = None
-        self._build_rules()
 
-    def _build_rules(self):
-        """Create overall expression with named items."""
-        rules = "|".join(
-            [f"(?P<{name}>{pattern})" for name, pattern in self._TOKEN_RULES.items()]
-        )
-        self._matcher = re.compile(rules)
+    @property
+    def script(self):
+        """The lines of the script being tokenized, for use in error messages."""
+        if self._script is None:
+            # Split only on "\n", as reading the file line by line does.
+            # `str.splitlines` also splits on other characters that can appear in comments
+            # and strings, which would shift the line numbers.
+            lines = self._source.split("\n")
+            self._script = [line + "\n" for line in lines[:-1]]
+            if lines[-1]:
+                self._script.append(lines[-1])
+        return self._script
 
     def _raise_error(self, error_msg, token):
+        token = Token._make(token)
         raise OptocadSyntaxError(
             error_msg,
             self._filename,
@@ -74,7 +95,7 @@ class OptocadTokenizer:
         )
 
     def _raise_lexing_error(self, token):
-        self._raise_error(f"illegal character {repr(token.value[0])}", token)
+        self._raise_error(f"illegal character {repr(token[4][0])}", token)
 
     def tokenize(self, string):
         """Tokenize specified `string`.
@@ -86,8 +107,8 @@ class OptocadTokenizer:
 
         Yields
         ------
-        :class:`.Token`
-            The next token read from `string`.
+        :class:`tuple`
+            The next token read from `string`, with the same layout as :class:`.Token`.
         """
         yield from self.tokenize_file(StringIO(string))
 
@@ -102,125 +123,100 @@ class OptocadTokenizer:
 
         Yields
         ------
-        :class:`.Token`
-            The next token read from `fobj`.
+        :class:`tuple`
+            The next token read from `fobj`, with the same layout as :class:`.Token`.
         """
         # Reset tokenizer state.
         self.done = False
         self._filename = fobj.name
         self.errors = []
-        self.script = []
         self._nesting = []
         self._lineno = 1
+
+        # Store the text for use in error messages.
+        text = self._source = fobj.read()
+        self._script = None
+
+        # The current string index in the file, and the index of the start of the
+        # current line within it. The start/stop values stored in tokens are relative to
+        # the start of the line, + 1. We also remember the total extra space characters
+        # used on the current line to compensate for tabs, which only take up 1
+        # character in the file but more when displayed.
         self._index = 0
-        previous_line = ""
-        line = ""
-
-        while True:
-            previous_line = line
-            line = fobj.readline()
-
-            # Lines are only empty at the end of the file (blank lines are "\n").
-            if not line:
-                break
-
-            linelength = len(line)
-            # Store the line for use in error messages.
-            self.script.append(line)
-
-            # The current string index on the current line. The start/stop values stored
-            # in tokens are this value + 1.
-            # This can be modified by the error function, so it's part of the object
-            # scope. We also remember the total extra space characters used to
-            # compensate for tabs, which only take up 1 character in the file but more
-            # when displayed.
-            self._index = 0
-            self._taboffset = 0
-
-            while self._index < linelength:
-                if line[self._index] in self._IGNORE:
-                    self._index += 1
-                    continue
-
-                matches = self._matcher.match(line, self._index)
-
-                if matches:
-                    value = matches.group()
-
-                    # Compensate for tabs. Tabs only take up one character but when
-                    # displayed take up whatever we decide here.
-                    start_index = self._index + self._taboffset + 1
-                    self._taboffset += (self._TAB_SIZE - 1) * value.count("\t")
-                    stop_index = matches.end() + self._taboffset + 1
-
-                    token_type = matches.lastgroup
-
-                    try:
-                        token = Token(
-                            lineno=self._lineno,
-                            start_index=start_index,
-                            stop_index=stop_index,
-                            type=token_type,
-                            value=value,
-                        )
-                    except SyntaxError as e:
-                        # There was an error determining the final value of the token.
-                        self._raise_error(
-                            e,
-                            Token(
-                                self._lineno,
-                                start_index,
-                                stop_index,
-                                token_type,
-                                value,
-                            ),
-                        )
-
-                    if token_callback := getattr(self, f"on_{token_type}", False):
-                        token_callback(token)
-
-                    self._index = matches.end()  # Updates index for next token.
-                else:
-                    # A lexing error.
-                    token = Token(
-                        self._lineno,
-                        start_index=self._index + 1,
-                        stop_index=linelength + 1,
-                        type="ERROR",
-                        value=line[self._index :],
-                    )
-                    # Leave it to the error function to advance the index and/or recover
-                    # the token.
-                    token = self._raise_lexing_error(token)
-
-                yield token
+        self._line_start = 0
+        self._taboffset = 0
+
+        for matches in self._MATCHER.finditer(text):
+            # Intern the type so the parser can compare it by identity.
+            token_type = sys.intern(matches.lastgroup)
+
+            if token_type == "IGNORE":
+                continue
+
+            start_index = matches.start() - self._line_start + 1
+
+            if token_type == "ERROR":
+                # A lexing error. Report the rest of the line.
+                line_end = text.find("\n", matches.start())
+                line_end = len(text) if line_end < 0 else line_end + 1
+                token = Token(
+                    type=token_type,
+                    value=text[matches.start() : line_end],
+                    lineno=self._lineno,
+                    start_index=start_index,
+                    stop_index=line_end - self._line_start + 1,
+                )
+                # Leave it to the error function to recover the token.
+                yield self._raise_lexing_error(token)
+                continue
+
+            value = matches.group()
+
+            if token_type == "LITERAL":
+                token_type = self._LITERAL_TYPES[value]
+
+            # Compensate for tabs. Tabs only take up one character but when displayed
+            # take up whatever we decide here. Only comments and strings can contain
+            # tabs, so this is rarely needed.
+            start_index += self._taboffset
+            if "\t" in value:
+                self._taboffset += (self._TAB_SIZE - 1) * value.count("\t")
+            self._index = matches.end()  # Updates index for next token.
+            stop_index = self._index - self._line_start + self._taboffset + 1
+
+            token = (self._lineno, start_index, stop_index, token_type, value)
+
+            if token_callback := getattr(self, f"on_{token_type}", False):
+                token_callback(token)
+
+            yield token
 
         if self._nesting:
             # Unclosed parenthesis/parentheses.
             for token in self._nesting:
-                self._raise_error(f"unclosed '{token.value}'", token)
+                self._raise_error(f"unclosed '{token[4]}'", token)
 
         # Add an implicit NEWLINE if the input doesn't end in one (this simplifies the
         # parser rules).
-        if not previous_line or (previous_line and previous_line[-1] not in "\r\n"):
-            yield Token(
-                self._lineno, self._index + 1, self._index + 1, "NEWLINE"
-            )
+        if not text or text[-1] not in "\r\n":
+            index = len(text) - self._line_start
+            yield (self._lineno, index + 1, index + 1, "NEWLINE", None)
             self._lineno += 1
-            self._index = 0
 
-        yield Token(self._lineno, 1, 1, "ENDMARKER")
+        yield (self._lineno, 1, 1, "ENDMARKER", None)
         self.done = True
 
     def on_NEWLINE(self, token):
-        self._lineno += len(token.value)
+        self._lineno += token[4].count("\n")
+        self._line_start = self._index
+        self._taboffset = 0
 
     def on_LBRACKET(self, token):
         self._nesting.append(token)
 
     def on_RBRACKET(self, token):
         try:
-            assert self._nesting.pop().value == "["
+            assert self._nesting.pop()[4] == "["
         except (IndexError, AssertionError):
             self._raise_error("extraneous ']'", token)
 
@@ -229,6 +225,6 @@ class OptocadTokenizer:
 
     def on_RPAREN(self, token):
         try:
-            assert self._nesting.pop().value == "("
+            assert self._nesting.pop()[4] == "("
         except (IndexError, AssertionError):
             self._raise_error("extraneous ')'", token)
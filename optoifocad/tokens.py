@@ -33,11 +33,12 @@ _FLOAT_NUMBER = group(_POINT_FLOAT, _EXPONENT_FLOAT)
 _SI_NUMBER = group(_INTEGER_NUMBER, _POINT_FLOAT) + r"[pnumkMGT]"
 _INFINITY = r"inf"
 _IMAGINARY_NUMBER = group(_INFINITY + r"[jJ]", r"[0-9](?:_?[0-9])*[jJ]", _FLOAT_NUMBER + r"[jJ]")
-NUMBER = group(_IMAGINARY_NUMBER, _SI_NUMBER, _FLOAT_NUMBER, _INTEGER_NUMBER, _INFINITY)
+# The lookahead lets the regex engine quickly rule out numbers for other tokens.
+NUMBER = r"(?=[0-9.i])" + group(_IMAGINARY_NUMBER, _SI_NUMBER, _FLOAT_NUMBER, _INTEGER_NUMBER, _INFINITY)
 
 _SINGLE_QUOTED_STRING = r"'[^\n'\\]*(?:\\.[^\n'\\]*)*'"
 _DOUBLE_QUOTED_STRING = r'"[^\n"\\]*(?:\\.[^\n"\\]*)*"'
-STRING = group(_SINGLE_QUOTED_STRING, _DOUBLE_QUOTED_STRING)
+STRING = r"(?=['\"])" + group(_SINGLE_QUOTED_STRING, _DOUBLE_QUOTED_STRING)
 
 # Types that only take one form. The order here is important (highest priority first).
 LITERALS = {